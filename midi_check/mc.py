@@ -1,7 +1,9 @@
 from .mc_utilities import MidiCheckUtilitiesMixin
+from .mc_printing import MidiCheckMessage
+from .mc_server import MidiCheckServerMixin
 
 
-class MIDI_CHECK(MidiCheckUtilitiesMixin):
+class MIDI_CHECK(MidiCheckUtilitiesMixin, MidiCheckServerMixin):
     """Class for managing MIDI checks and logging.
 
     This class provides functionality to create and manage tests, log messages,
@@ -18,6 +20,15 @@ class MIDI_CHECK(MidiCheckUtilitiesMixin):
         contexts (dict): A dictionary to initialize the root context.
         unnamed_tests (int): A counter for unnamed tests.
         current_path (list): A list representing the path to the current context.
+        records (list): Structured records mirroring each entry of `msg_log`.
+        record_times (list): Timestamps of the records, in logging order.
+        level_index (dict): Record ids grouped by logging level.
+        context_index (dict): Record id ranges grouped by context path.
+        context_counts (dict): Number of records logged in each context path.
+        test_index (dict): Record ids grouped by (context, name) test key.
+        status_version (int): Counter bumped each time a test is added or triggered.
+        report_server (ThreadingHTTPServer): The running report server, if any.
+        report_thread (Thread): The thread running the report server, if any.
 
     Examples:
         midi_check = MIDI_CHECK()
@@ -53,6 +64,15 @@ class MIDI_CHECK(MidiCheckUtilitiesMixin):
         self.contexts = {}  # Initialize the root context
         self.unnamed_tests = 0  # Counter for unnamed tests
         self.current_path = []  # Path to the current context
+        self.records = []  # Structured records, one per msg_log entry
+        self.record_times = []  # Timestamps of the records
+        self.level_index = {}  # Level -> record ids
+        self.context_index = {}  # Context path -> record id ranges
+        self.context_counts = {}  # Context path -> number of records
+        self.test_index = {}  # (context, name) test key -> record ids
+        self.status_version = 0  # Version of the latest test status change
+        self.report_server = None  # Optional live report server
+        self.report_thread = None  # Thread running the report server
 
 
     def Navigate(self, destination="children", logging=False):
@@ -224,13 +244,18 @@ class MIDI_CHECK(MidiCheckUtilitiesMixin):
             "result_key": result_key,
             "callback_true": callback_true,
             "callback_false": callback_false,
+            "level_true": getattr(callback_true, "level", "SUCCESS"),
+            "level_false": getattr(callback_false, "level", "FAIL"),
             "passed": False,
             "triggered": False,
-            "output": {}
+            "output": {},
+            "context": tuple(self.current_path[:-1]),  # Context owning "TESTS"
+            "version": 0
         }
 
         self._get_current_context()[name] = newTest
         self.tests.append(newTest)
+        self._touch_test(newTest)
         self.Navigate("parent")  # Return to the previous context
         self.Debug(f"Created test: {name}")
         return newTest  # Optionally return the test object if needed elsewhere
@@ -257,6 +282,7 @@ class MIDI_CHECK(MidiCheckUtilitiesMixin):
         result = test["test_fn"](val) and test["result_key"]
         self._trigger_messages(result, test)
         test["triggered"] = True
+        self._touch_test(test)
         return test
 
     def Cb_True(self, message, level="SUCCESS"):
@@ -271,10 +297,10 @@ class MIDI_CHECK(MidiCheckUtilitiesMixin):
             level (str): The logging level for the message. Defaults to "SUCCESS".
 
         Returns:
-            str: The formatted success message.
+            MidiCheckMessage: The formatted success message, remembering its level.
         """
 
-        return self._format_message(level, message, ignore=True)
+        return MidiCheckMessage(self._format_message(level, message, ignore=True), level)
 
     def Cb_False(self, message, level="FAIL"):
         """Formats a failure callback message.
@@ -288,6 +314,6 @@ class MIDI_CHECK(MidiCheckUtilitiesMixin):
             level (str): The logging level for the message. Defaults to "FAIL".
 
         Returns:
-            str: The formatted failure message.
+            MidiCheckMessage: The formatted failure message, remembering its level.
         """
-        return self._format_message(level, message, ignore=True)
+        return MidiCheckMessage(self._format_message(level, message, ignore=True), level)
@@ -0,0 +1,229 @@
+import heapq
+import time
+from itertools import chain, islice
+from bisect import bisect_left, bisect_right
+
+
+class MidiCheckIndexMixin:
+    """Mixin class keeping a queryable index of every logged record.
+
+    Every entry appended to `msg_log` is mirrored as a structured record in
+    `records`, sharing the same position, so that `records[i]` describes
+    `msg_log[i]`. Secondary indexes by level, context path and test allow
+    filtering large sessions without scanning the rendered strings or walking
+    the nested `contexts` dictionary.
+
+    Examples:
+        midi_check = MIDI_CHECK()
+        fails = midi_check.Query(level="FAIL", context="mapping/testing")
+        problems = midi_check.Query(min_level="WARNING")
+        history = midi_check.Query(test=midi_check.tests[0])
+        for record in fails:
+            print(record["message"])
+    """
+
+    def _index_record(self, level: str, message: str, test: tuple = None) -> dict:
+        """Appends a message to `msg_log` and indexes it as a record.
+
+        This method is the single entry point for writing to the message log.
+        It stores the rendered message, then records its level, context path,
+        test key and timestamp in the secondary indexes.
+
+        Args:
+            level (str): The logging level of the message.
+            message (str): The formatted message to be appended to the log.
+            test (tuple, optional): The (context, name) key of the test the message refers to. Defaults to None.
+
+        Returns:
+            dict: The newly created record.
+        """
+
+        record_id = len(self.msg_log)
+        path = tuple(self.current_path)
+        record = {
+            "id": record_id,
+            "level": level,
+            "message": message,
+            "path": path,
+            "test": test,
+            "time": time.time()
+        }
+        self.msg_log.append(message)
+        self.records.append(record)
+
+        # Time queries bisect record_times, so keep it sorted even if the
+        # wall clock steps backwards; the record keeps the actual time
+        if self.record_times and self.record_times[-1] > record["time"]:
+            self.record_times.append(self.record_times[-1])
+        else:
+            self.record_times.append(record["time"])
+
+        self.level_index.setdefault(level, []).append(record_id)
+        if test is not None:
+            self.test_index.setdefault(test, []).append(record_id)
+
+        # Consecutive records in the same context extend the last range
+        self.context_counts[path] = self.context_counts.get(path, 0) + 1
+        ranges = self.context_index.setdefault(path, [])
+        if ranges and ranges[-1][1] == record_id:
+            ranges[-1][1] = record_id + 1
+        else:
+            ranges.append([record_id, record_id + 1])
+        return record
+
+    def Query(self, level=None, min_level=None, context=None, test=None, since=None, until=None):
+        """Lazily yields the logged records matching all the given filters.
+
+        The most selective index drives the iteration, while the remaining
+        filters are checked on each candidate record. No intermediate list of
+        matches is built, so iterating can be stopped at any point.
+
+        Args:
+            level (str, optional): Exact logging level of the records. Defaults to None.
+            min_level (str, optional): Minimum logging level, compared using `levels` priorities. Defaults to None.
+            context (str or list, optional): Context path prefix, either as a list or a "/"-separated string. Defaults to None.
+            test (dict or tuple, optional): The test the records refer to, or its (context, name) key. Defaults to None.
+            since (float, optional): Earliest timestamp (inclusive) of the records. Defaults to None.
+            until (float, optional): Latest timestamp (inclusive) of the records. Defaults to None.
+
+        Returns:
+            generator: The matching records, in logging order.
+
+        Raises:
+            ValueError: If a level is not a known logging level.
+        """
+
+        for name in (level, min_level):
+            if name is not None and name not in self.levels:
+                raise ValueError(f"Unknown logging level: {name}")
+        if isinstance(context, str):
+            context = [part for part in context.split("/") if part]
+        prefix = tuple(context) if context is not None else None
+        if isinstance(test, dict):
+            test = self._test_key(test)
+        elif test is not None:
+            test_context, name = test
+            if isinstance(test_context, str):
+                test_context = [part for part in test_context.split("/") if part]
+            test = (tuple(test_context), name)
+
+        # Time filters are turned into a range of record ids
+        start = 0 if since is None else bisect_left(self.record_times, since)
+        stop = len(self.records) if until is None else bisect_right(self.record_times, until)
+
+        return self._query_records(level, min_level, prefix, test, start, stop)
+
+    def _query_records(self, level, min_level, prefix, test, start, stop):
+        """Yields the records within [start, stop) matching the given filters.
+
+        Args:
+            level (str): Exact logging level, or None.
+            min_level (str): Minimum logging level, or None.
+            prefix (tuple): Context path prefix, or None.
+            test (tuple): The (context, name) key of the test, or None.
+            start (int): First record id to consider.
+            stop (int): Record id at which to stop.
+
+        Returns:
+            generator: The matching records, in logging order.
+        """
+
+        candidates = []
+        if test is not None:
+            ids = self.test_index.get(test, [])
+            candidates.append((len(ids), self._ids_from(ids, start)))
+        if level is not None:
+            ids = self.level_index.get(level, [])
+            candidates.append((len(ids), self._ids_from(ids, start)))
+        if min_level is not None:
+            lists = self._level_lists(min_level)
+            candidates.append((sum(len(ids) for ids in lists),
+                               heapq.merge(*(self._ids_from(ids, start) for ids in lists))))
+        if prefix is not None:
+            paths = [path for path in self.context_counts if path[:len(prefix)] == prefix]
+            candidates.append((sum(self.context_counts[path] for path in paths),
+                               heapq.merge(*(self._context_ids(path, start) for path in paths))))
+        candidates.append((stop - start, iter(range(start, stop))))
+
+        # Iterate over the smallest candidate set, filter on the others
+        driver = min(candidates, key=lambda candidate: candidate[0])[1]
+        threshold = self.levels[min_level] if min_level is not None else None
+        for record_id in driver:
+            if record_id < start:
+                continue
+            if record_id >= stop:
+                return
+            record = self.records[record_id]
+            if level is not None and record["level"] != level:
+                continue
+            if threshold is not None and self.levels.get(record["level"], -1) < threshold:
+                continue
+            if prefix is not None and record["path"][:len(prefix)] != prefix:
+                continue
+            if test is not None and record["test"] != test:
+                continue
+            yield record
+
+    def _level_lists(self, level):
+        """Retrieves the record id lists of every level at or above the given one.
+
+        Args:
+            level (str): Minimum logging level.
+
+        Returns:
+            list: The record id lists of the matching levels.
+        """
+
+        threshold = self.levels[level]
+        return [ids for name, ids in self.level_index.items()
+                if self.levels.get(name, -1) >= threshold]
+
+    def _context_ids(self, path, start=0):
+        """Lazily yields the record ids logged in exactly the given context.
+
+        Ranges ending before start are skipped without being walked.
+
+        Args:
+            path (tuple): Context path.
+            start (int, optional): First record id to yield. Defaults to 0.
+
+        Returns:
+            iterator: The record ids of the context greater than or equal to start, in logging order.
+        """
+
+        # Ranges are sorted and disjoint: the first one to yield either
+        # contains start or is the first to begin after it
+        ranges = self.context_index[path]
+        first = bisect_right(ranges, [start, float("inf")])
+        if first > 0 and ranges[first - 1][1] > start:
+            first -= 1
+        return chain.from_iterable(range(max(begin, start), end)
+                                   for begin, end in islice(ranges, first, None))
+
+    def _test_key(self, test):
+        """Builds the key identifying a test across contexts.
+
+        Test names are only unique within the context they were added to, so
+        the key pairs the name with the path of that context.
+
+        Args:
+            test (dict): The test object.
+
+        Returns:
+            tuple: The (context, name) key of the test.
+        """
+
+        return (test["context"], test["name"])
+
+    def _ids_from(self, ids, start):
+        """Lazily yields the ids of a sorted list from a given id on.
+
+        Args:
+            ids (list): Sorted record ids.
+            start (int): First record id to yield.
+
+        Returns:
+            iterator: The record ids greater than or equal to start.
+        """
+
+        return islice(ids, bisect_left(ids, start), None)
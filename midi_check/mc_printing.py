@@ -1,4 +1,23 @@
-class MidiCheckPrintingMixin:
+from .mc_index import MidiCheckIndexMixin
+
+
+class MidiCheckMessage(str):
+    """Formatted message remembering the logging level it was rendered with.
+
+    Callback messages are rendered when a test is added but only logged when it
+    is triggered; keeping the level alongside lets them be indexed correctly.
+
+    Attributes:
+        level (str): The logging level the message was formatted with.
+    """
+
+    def __new__(cls, message: str, level: str):
+        formatted = super().__new__(cls, message)
+        formatted.level = level
+        return formatted
+
+
+class MidiCheckPrintingMixin(MidiCheckIndexMixin):
     """Mixin class for printing MIDI check information.
 
     This class provides methods to print debug information related to MIDI checks, including 
@@ -110,6 +129,6 @@ class MidiCheckPrintingMixin:
             formatted_message = f"{lvl}{indent}{flag}|{message}"
 
         if not ignore:
-            self.msg_log.append(formatted_message)
+            self._index_record(level, formatted_message)
 
         return formatted_message
@@ -0,0 +1,163 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class MidiCheckReportHandler(BaseHTTPRequestHandler):
+    """Request handler serving incremental reports of a MIDI_CHECK instance.
+
+    Two read-only endpoints are exposed, both answering in JSON:
+
+    - `/status?since=<version>`: the tests whose status changed after the given
+      version, grouped by context path, along with the current status version.
+    - `/log?cursor=<id>&limit=<n>`: the records logged from the given cursor on,
+      along with the cursor to use for the next request. The limit is capped
+      by the one the server was started with.
+    """
+
+    def do_GET(self):
+        """Dispatches a GET request to the matching report.
+
+        Returns:
+            None
+        """
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        try:
+            if url.path == "/status":
+                body = self.server.midi_check._status_delta(int(query.get("since", ["0"])[0]))
+            elif url.path == "/log":
+                # Cap the limit so one request cannot serialise the whole log
+                limit = min(int(query.get("limit", [self.server.limit])[0]), self.server.limit)
+                body = self.server.midi_check._log_delta(int(query.get("cursor", ["0"])[0]), limit)
+            else:
+                self.send_error(404, f"Unknown report: {url.path}")
+                return
+        except ValueError as error:
+            self.send_error(400, str(error))
+            return
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        """Silences the default request logging to keep the console for MIDI logs."""
+        pass
+
+
+class MidiCheckServerMixin:
+    """Mixin class serving live reports of the tests and logs over HTTP.
+
+    The server runs on a background daemon thread and only reads the state
+    kept by the logging path: the status version stamped on each test and the
+    `records` list. Clients poll with a version or cursor and only receive
+    what changed since, so long-running sessions never re-render the full log.
+    Status entries group tests by the path of the context they were added to.
+    Records about a test carry its [context, name] key in `test`, which joins
+    them to the status entries; their own `path` is the context the test was
+    triggered from, which may differ.
+
+    Examples:
+        midi_check = MIDI_CHECK()
+        host, port = midi_check.StartReportServer()
+        # GET http://127.0.0.1:<port>/status?since=0
+        # GET http://127.0.0.1:<port>/log?cursor=0
+        midi_check.StopReportServer()
+    """
+
+    def StartReportServer(self, host="127.0.0.1", port=0, limit=1000):
+        """Starts the report server on a background thread.
+
+        Args:
+            host (str): The address to bind the server to. Defaults to the loopback address.
+            port (int): The port to listen on, 0 picking a free one. Defaults to 0.
+            limit (int): Maximum number of records returned per log request. Defaults to 1000.
+
+        Returns:
+            tuple: The (host, port) address the server listens on.
+
+        Raises:
+            RuntimeError: If the report server is already running.
+        """
+
+        if self.report_server is not None:
+            raise RuntimeError("Report server is already running")
+
+        server = ThreadingHTTPServer((host, port), MidiCheckReportHandler)
+        server.daemon_threads = True
+        server.midi_check = self
+        server.limit = limit
+        thread = threading.Thread(target=server.serve_forever, name="midi-check-report", daemon=True)
+        thread.start()
+        self.report_server = server
+        self.report_thread = thread
+        self.Debug(f"Report server listening on {server.server_address[0]}:{server.server_address[1]}")
+        return server.server_address[:2]
+
+    def StopReportServer(self):
+        """Stops the report server if it is running.
+
+        Returns:
+            None
+        """
+
+        if self.report_server is None:
+            return
+        self.report_server.shutdown()
+        self.report_server.server_close()
+        self.report_thread.join()
+        self.report_server = None
+        self.report_thread = None
+        self.Debug("Report server stopped")
+
+    def _status_delta(self, since=0):
+        """Builds the status of the tests changed after a given version.
+
+        The current version is read before scanning the tests, so a test
+        changing during the scan is reported again on the next request.
+
+        Args:
+            since (int): The last status version known by the client. Defaults to 0.
+
+        Returns:
+            dict: The current version and the changed tests, as a list of
+                  {"path": [...], "tests": {...}} entries, one per context.
+        """
+
+        version = self.status_version
+        contexts = {}
+        for test in list(self.tests):
+            if test["version"] > since:
+                contexts.setdefault(test["context"], {})[test["name"]] = {
+                    "passed": test["passed"],
+                    "triggered": test["triggered"]
+                }
+        return {
+            "version": version,
+            "contexts": [{"path": list(path), "tests": tests} for path, tests in contexts.items()]
+        }
+
+    def _log_delta(self, cursor=0, limit=1000):
+        """Builds the list of records logged from a given cursor on.
+
+        Args:
+            cursor (int): The id of the first record to return. Defaults to 0.
+            limit (int): The maximum number of records to return. Defaults to 1000.
+
+        Returns:
+            dict: The records and the cursor to use for the next request.
+
+        Raises:
+            ValueError: If the cursor or the limit is negative.
+        """
+
+        if cursor < 0 or limit < 0:
+            raise ValueError("Cursor and limit must not be negative")
+        records = self.records[cursor:cursor + limit]
+        return {"records": records, "cursor": cursor + len(records)}
@@ -123,18 +123,35 @@ class MidiCheckUtilitiesMixin(MidiCheckPrintingMixin):
         Args:
             result (bool): The result of the test, indicating success or failure.
             test (dict): A dictionary containing test information, including its name,
-                        triggered status, passed status, and callback messages.
+                        triggered status, passed status, callback messages and their levels.
 
         Returns:
             None
         """
 
-        status = "SUCCESS" if result else "FAIL"
+        # Use the level the callback was rendered with
+        status = test["level_true"] if result else test["level_false"]
+        key = self._test_key(test)
         if test["triggered"]:
             if test["passed"] != result:
-                self.msg_log.append(self._format_message(status, f"{test['name']} was {'Passed' if result else 'Failed'}, now is:", ignore=True))
+                self._index_record(status, self._format_message(status, f"{test['name']} was {'Passed' if result else 'Failed'}, now is:", ignore=True), key)
             else:
-                self.msg_log.append(self._format_message(status, f"{test['name']} was {'Passed' if result else 'Failed'}, still is:", ignore=True))
+                self._index_record(status, self._format_message(status, f"{test['name']} was {'Passed' if result else 'Failed'}, still is:", ignore=True), key)
 
-        self.msg_log.append(test["callback_true"] if result else test["callback_false"])
-        test["passed"] = result
\ No newline at end of file
+        self._index_record(status, test["callback_true"] if result else test["callback_false"], key)
+        test["passed"] = result
+
+    def _touch_test(self, test):
+        """Stamps a test with a new status version after it changed.
+
+        Args:
+            test (dict): The test whose status changed.
+
+        Returns:
+            None
+        """
+
+        # Stamp the test before publishing the version, so a concurrent
+        # status request never reports a version the test has not reached
+        test["version"] = self.status_version + 1
+        self.status_version = test["version"]
@@ -0,0 +1,150 @@
+##
+# @file Contains tests for querying the log index
+import itertools
+import types
+
+import pytest
+
+from midi_check import mc_index
+from midi_check.mc import MIDI_CHECK
+
+
+def make_session():
+    # Build a session with tests triggered in nested contexts
+    mc = MIDI_CHECK("INFO")
+    always = mc.AddTest(test_fn=lambda x: x, name="always")
+    mc.Navigate("mapping")
+    mc.Navigate("testing")
+    mc.Warning("entering mapping tests")
+    mc.TriggerTest(always, False)
+    mc.TriggerTest(always, True)
+    mc.Error("mapping broke")
+    mc.Navigate("parent")
+    mc.Navigate("parent")
+    mc.TriggerTest(always, False)
+    return mc
+
+
+@pytest.fixture
+def ticking_clock(monkeypatch):
+    # Each record is logged one second after the previous one
+    ticks = itertools.count(1000.0)
+    monkeypatch.setattr(mc_index, "time", types.SimpleNamespace(time=lambda: next(ticks)))
+
+
+def ids(records):
+    return [record["id"] for record in records]
+
+
+def test_records_mirror_msg_log():
+    mc = make_session()
+    assert [record["message"] for record in mc.records] == mc.msg_log
+    assert ids(mc.records) == list(range(len(mc.msg_log)))
+
+
+def test_query_is_lazy():
+    mc = make_session()
+    assert isinstance(mc.Query(level="FAIL"), types.GeneratorType)
+
+
+def test_query_by_exact_level_and_context():
+    mc = make_session()
+    fails = list(mc.Query(level="FAIL", context="mapping/testing"))
+    assert [record["level"] for record in fails] == ["FAIL"]
+    assert fails[0]["path"] == ("mapping", "testing")
+    assert fails[0]["message"] == mc.tests[0]["callback_false"]
+    assert ids(mc.Query(level="ERROR")) == [11]
+    assert ids(mc.Query(level="ERROR", context="mapping")) == [11]
+    assert list(mc.Query(level="ERROR", context="Processor")) == []
+
+
+def test_query_by_min_level():
+    mc = make_session()
+    problems = list(mc.Query(min_level="WARNING", context="mapping/testing"))
+    assert [record["level"] for record in problems] == ["WARNING", "ERROR"]
+    at_least_fail = list(mc.Query(min_level="FAIL", context="mapping/testing"))
+    assert [record["level"] for record in at_least_fail] == ["WARNING", "FAIL", "SUCCESS", "SUCCESS", "ERROR"]
+
+
+def test_query_by_context_prefix():
+    mc = make_session()
+    under_mapping = list(mc.Query(context=["mapping"]))
+    assert all(record["path"][:1] == ("mapping",) for record in under_mapping)
+    assert ids(under_mapping) == sorted(ids(under_mapping))
+    testing = set(ids(mc.Query(context="mapping/testing")))
+    assert testing < set(ids(under_mapping))
+    assert testing == {record["id"] for record in mc.records if record["path"] == ("mapping", "testing")}
+
+
+def test_query_by_test():
+    mc = make_session()
+    history = list(mc.Query(test=mc.tests[0]))
+    assert [record["level"] for record in history] == ["FAIL", "SUCCESS", "SUCCESS", "FAIL", "FAIL"]
+    assert all(record["test"] == ((), "always") for record in history)
+    assert ids(mc.Query(test=((), "always"))) == ids(history)
+    assert ids(mc.Query(test=("", "always"))) == ids(history)
+    assert [record["path"] for record in mc.Query(test=mc.tests[0], context="mapping")] == [("mapping", "testing")] * 3
+    assert list(mc.Query(test=((), "missing"))) == []
+
+
+def test_query_tests_with_same_name():
+    mc = MIDI_CHECK("INFO")
+    root_test = mc.AddTest(test_fn=lambda x: x)
+    mc.Navigate("mapping")
+    mapping_test = mc.AddTest(test_fn=lambda x: x)
+    assert root_test["name"] == mapping_test["name"] == "test"
+    mc.TriggerTest(mapping_test, True)
+    mc.TriggerTest(root_test, False)
+    mc.TriggerTest(mapping_test, False)
+    assert [record["level"] for record in mc.Query(test=root_test)] == ["FAIL"]
+    assert [record["level"] for record in mc.Query(test=mapping_test)] == ["SUCCESS", "FAIL", "FAIL"]
+    assert all(record["test"] == (("mapping",), "test") for record in mc.Query(test=(["mapping"], "test")))
+
+
+def test_query_callback_level():
+    mc = MIDI_CHECK("INFO")
+    soft = mc.AddTest(test_fn=lambda x: x, callback_false=mc.Cb_False("soft", level="WARNING"), name="soft")
+    mc.TriggerTest(soft, False)
+    mc.TriggerTest(soft, False)
+    assert [record["level"] for record in mc.Query(test=soft)] == ["WARNING", "WARNING", "WARNING"]
+    assert ids(mc.Query(level="WARNING", test=soft)) == ids(mc.Query(test=soft))
+    assert list(mc.Query(level="FAIL")) == []
+
+
+def test_query_by_time(ticking_clock):
+    mc = make_session()
+    first, last = mc.records[0], mc.records[-1]
+    assert list(mc.Query(since=last["time"]))[-1] is last
+    assert list(mc.Query(until=first["time"] - 1)) == []
+
+    # A window in the middle excludes records on both sides
+    window = list(mc.Query(since=first["time"] + 3, until=first["time"] + 5.5))
+    assert ids(window) == [3, 4, 5]
+    assert ids(mc.Query(test=mc.tests[0], since=first["time"] + 3, until=first["time"] + 10)) == [8, 9, 10]
+    assert ids(mc.Query(context="mapping", since=first["time"] + 6, until=first["time"] + 12)) == [6, 7, 8, 9, 10, 11, 12]
+
+
+def test_context_ids_start_inside_ranges():
+    mc = make_session()
+    root = [record["id"] for record in mc.records if record["path"] == ()]
+    for start in range(len(mc.records) + 1):
+        assert list(mc._context_ids((), start)) == [record_id for record_id in root if record_id >= start]
+
+
+def test_query_by_time_with_clock_stepping_back(monkeypatch):
+    clock = iter([10.0, 20.0, 5.0, 30.0])
+    monkeypatch.setattr(mc_index, "time", types.SimpleNamespace(time=lambda: next(clock)))
+    mc = MIDI_CHECK("INFO")
+    for message in ["a", "b", "c", "d"]:
+        mc.Log(message, "INFO", True)
+    assert mc.records[2]["time"] == 5.0
+    assert mc.record_times == [10.0, 20.0, 20.0, 30.0]
+    assert ids(mc.Query(since=15.0)) == [1, 2, 3]
+
+
+def test_query_unknown_level():
+    mc = make_session()
+    with pytest.raises(ValueError):
+        mc.Query(level="VERBOSE")
+    with pytest.raises(ValueError):
+        mc.Query(min_level="VERBOSE")
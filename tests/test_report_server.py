@@ -0,0 +1,71 @@
+##
+# @file Contains tests for the live report server
+import json
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from midi_check.mc import MIDI_CHECK
+
+
+def get(address, report):
+    with urlopen(f"http://{address[0]}:{address[1]}{report}", timeout=5) as response:
+        return json.loads(response.read())
+
+
+def test_report_server_deltas():
+    mc = MIDI_CHECK("INFO")
+    always = mc.AddTest(test_fn=lambda x: x, name="always")
+    mc.Navigate("mapping")
+    other = mc.AddTest(test_fn=lambda x: x, name="other")
+    address = mc.StartReportServer()
+    try:
+        status = get(address, "/status?since=0")
+        assert status["contexts"] == [
+            {"path": [], "tests": {"always": {"passed": False, "triggered": False}}},
+            {"path": ["mapping"], "tests": {"other": {"passed": False, "triggered": False}}}
+        ]
+
+        # Only the triggered test is sent again
+        mc.TriggerTest(other, True)
+        delta = get(address, f"/status?since={status['version']}")
+        assert delta["contexts"] == [{"path": ["mapping"], "tests": {"other": {"passed": True, "triggered": True}}}]
+        assert get(address, f"/status?since={delta['version']}")["contexts"] == []
+
+        # Log records are tailed from a cursor
+        log = get(address, "/log?cursor=0&limit=2")
+        assert [record["message"] for record in log["records"]] == mc.msg_log[:2]
+        tail = get(address, f"/log?cursor={log['cursor']}")
+        assert [record["message"] for record in tail["records"]] == mc.msg_log[2:]
+        mc.TriggerTest(always, False)
+        tail = get(address, f"/log?cursor={tail['cursor']}")
+        always_entry = next(entry for entry in status["contexts"] if "always" in entry["tests"])
+        assert [record["test"] for record in tail["records"]] == [[always_entry["path"], "always"]]
+        # Triggered from "mapping", although the test belongs to the root context
+        assert [record["path"] for record in tail["records"]] == [["mapping"]]
+
+        for report, code in [("/unknown", 404), ("/log?cursor=-1", 400), ("/status?since=abc", 400)]:
+            with pytest.raises(HTTPError) as error:
+                get(address, report)
+            assert error.value.code == code
+
+        with pytest.raises(RuntimeError):
+            mc.StartReportServer()
+    finally:
+        mc.StopReportServer()
+    assert mc.report_server is None
+
+
+def test_report_server_caps_log_limit():
+    mc = MIDI_CHECK("INFO")
+    for message in ["a", "b", "c", "d", "e"]:
+        mc.Log(message, "INFO", True)
+    address = mc.StartReportServer(limit=3)
+    try:
+        log = get(address, "/log?cursor=0&limit=100000000")
+        assert [record["id"] for record in log["records"]] == [0, 1, 2]
+        assert log["cursor"] == 3
+        assert len(get(address, "/log?cursor=0&limit=2")["records"]) == 2
+    finally:
+        mc.StopReportServer()